@@ -1,28 +1,140 @@
 """
 Boundary handling for polygon operations and coordinate transformations.
 """
+from functools import lru_cache
 from typing import List, Tuple, Optional
+import numpy as np
+import pandas as pd
+import shapely
 from shapely.geometry import Polygon, Point
-from shapely.ops import transform
+from shapely.ops import transform, unary_union
+from shapely.prepared import prep
 import pyproj
 import logging
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Relative turn (cross product over the adjacent edge lengths) below which
+# a vertex is treated as collinear by the convexity test
+_COLLINEAR_TOLERANCE = 1e-12
+
+if NUMBA_AVAILABLE:
+    # Explicit signature compiles eagerly at import; cache=True persists the
+    # compiled kernel in __pycache__ so later runs skip the JIT step
+    @njit("boolean[:](float64[:, :], float64[:, :])", parallel=True, cache=True, fastmath=True)
+    def _pip_batch(pts, poly):
+        """Ray-casting point-in-ring test for an (N, 2) batch against an (M, 2) ring."""
+        n = pts.shape[0]
+        m = poly.shape[0]
+        inside = np.zeros(n, dtype=np.bool_)
+        for i in prange(n):
+            x = pts[i, 0]
+            y = pts[i, 1]
+            crossing = False
+            j = m - 1
+            for k in range(m):
+                xk = poly[k, 0]
+                yk = poly[k, 1]
+                xj = poly[j, 0]
+                yj = poly[j, 1]
+                if (yk > y) != (yj > y):
+                    if x < (xj - xk) * (y - yk) / (yj - yk) + xk:
+                        crossing = not crossing
+                j = k
+            inside[i] = crossing
+        return inside
+
+def _convex_half_planes(rings: List[np.ndarray]) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Get inward edge half-planes for a convex polygon without holes.
+    
+    Args:
+        rings: Ring vertex arrays of the polygon (exterior first, then holes)
+        
+    Returns:
+        Optional[Tuple]: (nx, ny, d) with a*x + b*y + d > 0 inside every edge,
+            or None if the polygon has holes or is not convex
+    """
+    if len(rings) != 1:
+        return None
+        
+    vertices = rings[0][:-1]
+    edges = np.roll(vertices, -1, axis=0) - vertices
+    # Drop repeated vertices so zero-length edges don't register as turns
+    keep = np.any(edges != 0, axis=1)
+    vertices, edges = vertices[keep], edges[keep]
+    if len(vertices) < 3:
+        return None
+        
+    next_edges = np.roll(edges, -1, axis=0)
+    turns = edges[:, 0] * next_edges[:, 1] - edges[:, 1] * next_edges[:, 0]
+    # Collinear vertices leave rounding noise in their turn, so turns within
+    # a tolerance scaled by the adjacent edge lengths count as straight
+    lengths = np.hypot(edges[:, 0], edges[:, 1])
+    tolerance = _COLLINEAR_TOLERANCE * lengths * np.roll(lengths, -1)
+    turns = np.where(np.abs(turns) <= tolerance, 0.0, turns)
+    if not (np.all(turns >= 0) or np.all(turns <= 0)) or not turns.any():
+        return None
+        
+    # Rotate edges a quarter turn towards the interior
+    orientation = 1.0 if turns.sum() > 0 else -1.0
+    nx = -edges[:, 1] * orientation
+    ny = edges[:, 0] * orientation
+    d = -(nx * vertices[:, 0] + ny * vertices[:, 1])
+    return nx, ny, d
+
 class BoundaryHandler:
     """Handle polygon boundaries and coordinate transformations."""
     
-    def __init__(self, polygons: List[Polygon], polygon_attributes: Optional[List[dict]] = None):
+    def __init__(self, polygons: List[Polygon], polygon_attributes: Optional[List[dict]] = None,
+                 _skip_validate: bool = False):
         """
         Initialize with a list of polygons and optional attributes.
         
         Args:
             polygons: List of shapely Polygon objects
             polygon_attributes: List of attribute dictionaries (optional)
+            _skip_validate: Internal; trust polygons already validated by another handler
         """
         self.polygons = polygons
         self.polygon_attributes = polygon_attributes or [{}] * len(polygons)
-        self._validate_polygons()
+        if not _skip_validate:
+            self._validate_polygons()
+        
+        # Derived geometry is computed lazily and memoized by the getters
+        self._combined = None
+        self._bounds = None
+        self._polygon_bounds = None
+        self._signed_bounds = None
+        self._area = None
+        
+        # Prepared polygons index their edges once for repeated contains checks
+        self._prepared = [prep(polygon) for polygon in self.polygons]
+        
+        # Spatial index so lookups only test polygons whose envelope matches
+        self._tree = shapely.STRtree(self.polygons)
+        
+        # Attribute table for vectorized filtering
+        self._attr_df = pd.DataFrame(self.polygon_attributes, index=range(len(self.polygons)))
+        
+        # Ring vertices (exterior first, then holes, for each part of a
+        # MultiPolygon) for the numba fast path; the even-odd rule over all of
+        # a valid geometry's rings gives the same answer as testing its parts
+        self._poly_coords = [
+            [np.ascontiguousarray(np.asarray(ring.coords)[:, :2], dtype=np.float64)
+             for part in shapely.get_parts(polygon)
+             for ring in (part.exterior, *part.interiors)]
+            for polygon in self.polygons
+        ]
+        
+        # Edge half-planes for convex polygons, None for the rest
+        self._half_planes = [_convex_half_planes(rings) for rings in self._poly_coords]
         
     def _validate_polygons(self):
         """Validate that all polygons are valid."""
@@ -49,16 +161,19 @@ class BoundaryHandler:
             logger.error("No valid polygons available")
             return None
             
-        if len(self.polygons) == 1:
-            return self.polygons[0]
+        if self._combined is not None:
+            return self._combined
             
         try:
-            # Union all polygons
-            combined = self.polygons[0]
-            for polygon in self.polygons[1:]:
-                combined = combined.union(polygon)
+            if len(self.polygons) == 1:
+                self._combined = self.polygons[0]
+            else:
+                # Cascaded union instead of pairwise unions in a loop
+                self._combined = unary_union(self.polygons)
                 
-            return combined
+            # Prepare once so batched contains_xy calls reuse the edge index
+            shapely.prepare(self._combined)
+            return self._combined
             
         except Exception as e:
             logger.error(f"Error combining polygons: {str(e)}")
@@ -78,14 +193,136 @@ class BoundaryHandler:
             return False
             
         try:
-            for polygon in self.polygons:
-                if polygon.contains(point):
+            for i in self._tree.query(point):
+                if self._prepared[i].contains(point):
                     return True
             return False
             
         except Exception as e:
             logger.error(f"Error checking point containment: {str(e)}")
             return False
+
+    def contains_xy(self, x: float, y: float) -> bool:
+        """
+        Check if a coordinate is inside any of the boundary polygons.
+
+        Same test as contains_point, without building a Point: candidates come
+        from the per-polygon bounds, so a coordinate on an edge shared by two
+        polygons is on the boundary of each and counts as outside.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            bool: True if the coordinate is inside any boundary
+        """
+        if not self.polygons:
+            return False
+
+        try:
+            if self._signed_bounds is None:
+                # (-minx, -miny, maxx, maxy) rows turn the envelope test into
+                # a single comparison against (-x, -y, x, y)
+                bounds = self.get_polygon_bounds()
+                self._signed_bounds = np.hstack((-bounds[:, :2], bounds[:, 2:]))
+            candidates = np.flatnonzero((np.array((-x, -y, x, y)) <= self._signed_bounds).all(axis=1))
+            # Polygons were prepared in place by prep() in __init__
+            for i in candidates:
+                if shapely.contains_xy(self.polygons[i], x, y):
+                    return True
+            return False
+
+        except Exception as e:
+            logger.error(f"Error checking point containment: {str(e)}")
+            return False
+
+    def contains_points(self, xs: np.ndarray, ys: np.ndarray,
+                        index: Optional[int] = None) -> np.ndarray:
+        """
+        Check which coordinates are inside any of the boundary polygons.
+        
+        Args:
+            xs: Array of X coordinates
+            ys: Array of Y coordinates
+            index: Only test against the polygon at this index (optional)
+            
+        Returns:
+            np.ndarray: Boolean mask, True where the point is inside a boundary
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if not self.polygons:
+            return np.zeros(xs.shape, dtype=bool)
+            
+        try:
+            # Polygons are already prepared by their PreparedGeometry wrappers
+            geometry = self.polygons[index] if index is not None else self.get_combined_boundary()
+            return shapely.contains_xy(geometry, xs, ys)
+            
+        except Exception as e:
+            logger.error(f"Error checking point containment: {str(e)}")
+            return np.zeros(xs.shape, dtype=bool)
+    
+    def contains_points_fast(self, xs: np.ndarray, ys: np.ndarray,
+                             index: Optional[int] = None) -> np.ndarray:
+        """
+        Check which coordinates are inside any boundary using the fastest available test.
+        
+        Convex polygons use a vectorized half-plane test, others the numba
+        kernel; without numba those fall back to contains_points.
+        
+        Args:
+            xs: Array of X coordinates
+            ys: Array of Y coordinates
+            index: Only test against the polygon at this index (optional)
+            
+        Returns:
+            np.ndarray: Boolean mask, True where the point is inside a boundary
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if not self.polygons:
+            return np.zeros(xs.shape, dtype=bool)
+            
+        if index is None and len(self.polygons) == 1:
+            index = 0
+        if index is not None and self._half_planes[index] is not None:
+            return self._contains_convex(index, xs, ys)
+        if not NUMBA_AVAILABLE:
+            return self.contains_points(xs, ys, index)
+            
+        pts = np.column_stack((xs, ys))
+        mask = np.zeros(len(pts), dtype=bool)
+        if index is not None:
+            groups = [(index, np.arange(len(pts)))]
+        else:
+            # Envelope candidates from the STRtree, grouped by polygon
+            point_idx, polygon_idx = self._tree.query(shapely.points(xs, ys))
+            order = np.argsort(polygon_idx, kind="stable")
+            point_idx, polygon_idx = point_idx[order], polygon_idx[order]
+            polygon_ids, starts = np.unique(polygon_idx, return_index=True)
+            groups = zip(polygon_ids, np.split(point_idx, starts[1:]))
+            
+        for i, candidates in groups:
+            if self._half_planes[i] is not None:
+                polygon_mask = self._contains_convex(i, xs[candidates], ys[candidates])
+            else:
+                candidate_pts = pts[candidates]
+                # Even-odd rule: holes toggle points back out of the exterior
+                polygon_mask = np.zeros(len(candidates), dtype=bool)
+                for ring in self._poly_coords[i]:
+                    polygon_mask ^= _pip_batch(candidate_pts, ring)
+            mask[candidates[polygon_mask]] = True
+        return mask
+    
+    def _contains_convex(self, index: int, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Half-plane containment test for the convex polygon at index."""
+        nx, ny, d = self._half_planes[index]
+        mask = np.ones(xs.shape, dtype=bool)
+        for a, b, c in zip(nx, ny, d):
+            mask &= a * xs + b * ys + c > 0
+        return mask
     
     def get_bounds(self) -> Optional[Tuple[float, float, float, float]]:
         """
@@ -97,16 +334,50 @@ class BoundaryHandler:
         if not self.polygons:
             return None
             
+        if self._bounds is not None:
+            return self._bounds
+            
         try:
-            combined = self.get_combined_boundary()
-            if combined:
-                return combined.bounds
-            return None
+            # Envelope of the per-polygon envelopes; no union required
+            all_bounds = self.get_polygon_bounds()
+            self._bounds = (
+                float(all_bounds[:, 0].min()),
+                float(all_bounds[:, 1].min()),
+                float(all_bounds[:, 2].max()),
+                float(all_bounds[:, 3].max()),
+            )
+            return self._bounds
             
         except Exception as e:
             logger.error(f"Error getting bounds: {str(e)}")
             return None
     
+    def get_polygon_bounds(self) -> np.ndarray:
+        """
+        Get the bounding box of each polygon.
+        
+        Returns:
+            np.ndarray: (N, 4) array of (minx, miny, maxx, maxy) rows
+        """
+        if self._polygon_bounds is None:
+            self._polygon_bounds = np.array(
+                [polygon.bounds for polygon in self.polygons], dtype=np.float64
+            ).reshape(-1, 4)
+        return self._polygon_bounds
+
+    def get_polygon_rings(self, index: int) -> List[np.ndarray]:
+        """
+        Get the ring vertices of one polygon.
+
+        Args:
+            index: Position of the polygon in self.polygons
+
+        Returns:
+            List[np.ndarray]: (M, 2) float64 arrays, exterior ring first, then holes
+                (repeated per part for a MultiPolygon)
+        """
+        return self._poly_coords[index]
+
     def get_area(self) -> float:
         """
         Get the total area of all polygons in square degrees.
@@ -117,9 +388,12 @@ class BoundaryHandler:
         if not self.polygons:
             return 0.0
             
+        if self._area is not None:
+            return self._area
+            
         try:
-            total_area = sum(polygon.area for polygon in self.polygons)
-            return total_area
+            self._area = sum(polygon.area for polygon in self.polygons)
+            return self._area
             
         except Exception as e:
             logger.error(f"Error calculating area: {str(e)}")
@@ -140,19 +414,32 @@ class BoundaryHandler:
             logger.warning("No polygon attributes available for filtering")
             return self
             
-        filtered_polygons = []
-        filtered_attributes = []
+        # Case-insensitive substring match; missing or non-string values never match
+        mask = np.zeros(len(self.polygons), dtype=bool)
+        if field in self._attr_df.columns:
+            try:
+                mask = self._attr_df[field].str.contains(
+                    value, case=False, regex=False, na=False
+                ).to_numpy(dtype=bool)
+            except AttributeError:
+                # Column holds no string values at all
+                pass
+            
+        matched = np.flatnonzero(mask)
+        filtered_polygons = [self.polygons[i] for i in matched]
+        filtered_attributes = [self.polygon_attributes[i] for i in matched]
         
-        for i, (polygon, attributes) in enumerate(zip(self.polygons, self.polygon_attributes)):
-            # Check if the attribute matches
-            attr_value = attributes.get(field, '')
-            if isinstance(attr_value, str) and value.lower() in attr_value.lower():
-                filtered_polygons.append(polygon)
-                filtered_attributes.append(attributes)
-                logger.debug(f"Matched polygon {i+1}: {field}={attr_value}")
+        for i in matched:
+            logger.debug(f"Matched polygon {i+1}: {field}={self.polygon_attributes[i][field]}")
         
         logger.info(f"Filtered to {len(filtered_polygons)} polygons matching {field}={value}")
-        return BoundaryHandler(filtered_polygons, filtered_attributes)
+        # Polygons come from this (already validated) handler
+        return BoundaryHandler(filtered_polygons, filtered_attributes, _skip_validate=True)
+
+@lru_cache(maxsize=16)
+def _cached_transformer(from_crs: str, to_crs: str) -> pyproj.Transformer:
+    """Build (or reuse) a pyproj Transformer; PROJ pipeline setup is expensive."""
+    return pyproj.Transformer.from_crs(from_crs, to_crs, always_xy=True)
 
 class CoordinateTransformer:
     """Handle coordinate system transformations."""
@@ -171,9 +458,7 @@ class CoordinateTransformer:
         
         if from_crs != to_crs:
             try:
-                self.transformer = pyproj.Transformer.from_crs(
-                    from_crs, to_crs, always_xy=True
-                )
+                self.transformer = _cached_transformer(from_crs, to_crs)
             except Exception as e:
                 logger.error(f"Error creating coordinate transformer: {str(e)}")
     
@@ -198,6 +483,29 @@ class CoordinateTransformer:
             logger.error(f"Error transforming coordinates: {str(e)}")
             return (x, y)
     
+    def transform_points(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Transform arrays of coordinates from source CRS to target CRS in one call.
+        
+        Args:
+            xs: Array of X coordinates
+            ys: Array of Y coordinates
+            
+        Returns:
+            Tuple: (transformed_xs, transformed_ys) as numpy arrays
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if self.transformer is None:
+            return (xs, ys)
+            
+        try:
+            transformed_xs, transformed_ys = self.transformer.transform(xs, ys)
+            return (transformed_xs, transformed_ys)
+        except Exception as e:
+            logger.error(f"Error transforming coordinates: {str(e)}")
+            return (xs, ys)
+    
     def transform_polygon(self, polygon: Polygon) -> Polygon:
         """
         Transform a polygon from source CRS to target CRS.
@@ -9,15 +9,23 @@ Designed for agricultural fieldwork and research sampling.
 """
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Keep BLAS/OpenMP single-threaded so they do not oversubscribe cores
+# alongside numba's parallel kernels; must be set before numpy is imported
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
+import shapely
+
 from .loader import load_kml_file, KMLLoader
-from .boundary import create_boundary_handler
-from .generator import generate_sampling_points
+from .boundary import create_boundary_handler, CoordinateTransformer, NUMBA_AVAILABLE
+from .generator import RandomPointGenerator
 from .exporter import export_sampling_points, SamplingPointExporter
-from .utils import meters_to_degrees, get_center_latitude
+from .utils import get_utm_crs
 
 # Configure logging
 logging.basicConfig(
@@ -104,6 +112,18 @@ Author: Cole Regnier (Cornell University, Gold Lab) - nr466@cornell.edu
         help="Output format (default: csv)"
     )
     
+    parser.add_argument(
+        "--threads",
+        type=int,
+        help="Number of threads for numba-accelerated kernels (default: all cores)"
+    )
+    
+    parser.add_argument(
+        "--use_pyarrow",
+        action="store_true",
+        help="Write the CSV with pyarrow (faster for large outputs; requires pyarrow)"
+    )
+    
     parser.add_argument(
         "--summary",
         help="Path to save summary report (optional)"
@@ -152,6 +172,11 @@ def validate_arguments(args: argparse.Namespace) -> bool:
         logger.error("Minimum distance in meters must be positive")
         return False
     
+    # Check thread count
+    if args.threads is not None and args.threads <= 0:
+        logger.error("Number of threads must be positive")
+        return False
+    
     return True
 
 def main():
@@ -174,6 +199,14 @@ def main():
     if not validate_arguments(args):
         sys.exit(1)
     
+    # Configure numba parallelism
+    if args.threads is not None:
+        if NUMBA_AVAILABLE:
+            import numba
+            numba.set_num_threads(min(args.threads, numba.config.NUMBA_NUM_THREADS))
+        else:
+            logger.warning("numba is not installed, ignoring --threads")
+    
     try:
         logger.info("Starting random sampling point generation")
         logger.info(f"Input file: {args.file}")
@@ -231,40 +264,48 @@ def main():
         if area > 0:
             logger.info(f"Boundary area: {area:.6f} square degrees")
         
-        # Step 3: Generate sampling points
-        logger.info("Generating sampling points per polygon with minimum distance...")
-        
-        # Get boundary bounds to calculate center latitude
-        bounds = boundary_handler.get_bounds()
-        if bounds:
-            center_lat = get_center_latitude(bounds)
-            min_distance_degrees = meters_to_degrees(args.min_distance_meters, center_lat)
-            logger.info(f"Converting {args.min_distance_meters} meters to {min_distance_degrees:.6f} degrees at latitude {center_lat:.2f}")
-        else:
-            logger.warning("Could not determine boundary bounds, using default latitude (0.0)")
-            min_distance_degrees = meters_to_degrees(args.min_distance_meters, 0.0)
+        # Step 3: Project boundaries to a metric CRS
+        if not bounds:
+            logger.error("Could not determine boundary bounds")
+            sys.exit(1)
+            
+        utm_crs = get_utm_crs(bounds)
+        to_utm = CoordinateTransformer("EPSG:4326", utm_crs)
+        from_utm = CoordinateTransformer(utm_crs, "EPSG:4326")
+        if to_utm.transformer is None or from_utm.transformer is None:
+            logger.error(f"Could not create coordinate transformer for {utm_crs}")
+            sys.exit(1)
+            
+        logger.info(f"Projecting boundaries to {utm_crs}...")
+        projected_handler = create_boundary_handler(
+            [to_utm.transform_polygon(polygon) for polygon in boundary_handler.polygons],
+            boundary_handler.polygon_attributes
+        )
+        logger.info(f"Projected boundary area: {projected_handler.get_area():.1f} square meters")
         
-        # Prepare generation arguments
-        gen_kwargs = {
-            "seed": args.seed,
-            "min_distance": min_distance_degrees
-        }
+        # Step 4: Generate sampling points
+        logger.info("Generating sampling points per polygon with minimum distance...")
         
-        points = generate_sampling_points(
-            boundary_handler, 
-            args.n_points, 
-            "min_distance", 
-            per_polygon=True,
-            **gen_kwargs
+        # Sample as raw coordinates; Points are only built once, after projecting back
+        generator = RandomPointGenerator(projected_handler)
+        xy = generator.generate_points_per_polygon_array(
+            args.n_points,
+            seed=args.seed,
+            min_distance=args.min_distance_meters,
+            parallel=True
         )
         
-        if not points:
+        if len(xy) == 0:
             logger.error("Failed to generate sampling points")
             sys.exit(1)
         
+        # Project points back to longitude/latitude for export
+        lons, lats = from_utm.transform_points(xy[:, 0], xy[:, 1])
+        points = list(shapely.points(lons, lats))
+        
         logger.info(f"Generated {len(points)} sampling points")
         
-        # Step 4: Export points
+        # Step 5: Export points
         logger.info("Exporting sampling points...")
         
         # Parse metadata
@@ -276,7 +317,8 @@ def main():
             "sample_prefix": args.sample_prefix,
             "apply_to_group": args.apply_to_group,
             "n_points": args.n_points,
-            "min_distance_meters": args.min_distance_meters
+            "min_distance_meters": args.min_distance_meters,
+            "use_pyarrow": args.use_pyarrow
         }
         
         success = export_sampling_points(
@@ -290,7 +332,7 @@ def main():
             logger.error("Failed to export sampling points")
             sys.exit(1)
         
-        # Step 5: Export summary report if requested
+        # Step 6: Export summary report if requested
         if args.summary:
             logger.info("Generating summary report...")
             exporter = SamplingPointExporter()
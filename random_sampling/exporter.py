@@ -3,12 +3,26 @@ Export sampling points to various formats (CSV, GeoJSON, etc.).
 """
 from typing import List, Dict, Any, Optional
 from pathlib import Path
+import csv
+import numpy as np
 import pandas as pd
+import shapely
 from shapely.geometry import Point
 import logging
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Exports larger than this are streamed with csv.writer by default
+STREAM_THRESHOLD = 100_000
+STREAM_CHUNK_SIZE = 65_536
+
 class SamplingPointExporter:
     """Export sampling points to various file formats."""
     
@@ -77,12 +91,42 @@ class SamplingPointExporter:
         
         return "_".join(prefix_parts)
     
+    def _write_csv_stream(self, output_path: Path, coords: np.ndarray,
+                          descriptive_prefix: str,
+                          metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Write sampling points to CSV in fixed-size chunks without a DataFrame.
+        
+        Args:
+            output_path: Path to output CSV file
+            coords: (N, 2) array of longitude/latitude coordinates
+            descriptive_prefix: Prefix for sample names
+            metadata: Additional metadata to include
+        """
+        metadata = metadata or {}
+        header = ["sample_name", "longitude", "latitude", "point_id"]
+        header += [f"metadata_{key}" for key in metadata]
+        metadata_values = tuple(metadata.values())
+        
+        with open(output_path, "w", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(header)
+            for start in range(0, len(coords), STREAM_CHUNK_SIZE):
+                chunk = coords[start:start + STREAM_CHUNK_SIZE]
+                point_ids = range(start + 1, start + len(chunk) + 1)
+                writer.writerows(
+                    (f"{descriptive_prefix}_{point_id:04d}", x, y, point_id) + metadata_values
+                    for point_id, x, y in zip(point_ids, chunk[:, 0].tolist(), chunk[:, 1].tolist())
+                )
+    
     def export_to_csv(self, points: List[Point], output_path: str, 
                      metadata: Optional[Dict[str, Any]] = None,
                      sample_prefix: str = "SAMPLE",
                      apply_to_group: Optional[str] = None,
                      n_points: int = 1,
-                     min_distance_meters: float = 5.0) -> bool:
+                     min_distance_meters: float = 5.0,
+                     use_pyarrow: bool = False,
+                     stream: Optional[bool] = None) -> bool:
         """
         Export sampling points to CSV format.
         
@@ -94,6 +138,10 @@ class SamplingPointExporter:
             apply_to_group: Filter applied (for naming)
             n_points: Number of points per polygon (for naming)
             min_distance_meters: Minimum distance in meters (for naming)
+            use_pyarrow: Write the CSV with pyarrow's writer when it is installed
+            stream: Write rows in chunks with csv.writer instead of building a
+                DataFrame; defaults to True above STREAM_THRESHOLD points unless
+                pyarrow was requested and is installed
             
         Returns:
             bool: True if successful, False otherwise
@@ -108,32 +156,50 @@ class SamplingPointExporter:
                 sample_prefix, apply_to_group, n_points, min_distance_meters
             )
             
-            # Prepare data for DataFrame
-            data = []
-            for i, point in enumerate(points):
-                sample_data = {
-                    "sample_name": f"{descriptive_prefix}_{i+1:04d}",
-                    "longitude": point.x,
-                    "latitude": point.y,
-                    "point_id": i + 1
-                }
-                
-                # Add metadata if provided
-                if metadata:
-                    for key, value in metadata.items():
-                        sample_data[f"metadata_{key}"] = value
-                        
-                data.append(sample_data)
-                
-            # Create DataFrame
-            df = pd.DataFrame(data)
+            # Read all coordinates in one call instead of per-point accessors
+            coords = shapely.get_coordinates(points)
             
             # Ensure output directory exists
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
+            if stream is None:
+                # An explicit pyarrow request wins over automatic streaming
+                stream = len(coords) > STREAM_THRESHOLD and not (use_pyarrow and PYARROW_AVAILABLE)
+                
+            if stream:
+                if use_pyarrow:
+                    reason = "streaming was requested" if PYARROW_AVAILABLE else "pyarrow is not installed"
+                    logger.warning(f"Ignoring use_pyarrow because {reason}; writing with csv.writer")
+                self._write_csv_stream(output_path, coords, descriptive_prefix, metadata)
+                logger.info(f"Exported {len(points)} points to {output_path}")
+                return True
+                
+            n = len(coords)
+            point_ids = np.arange(1, n + 1)
+            
+            # Zero-padded sample names built with vectorized string ops
+            sample_names = np.char.add(f"{descriptive_prefix}_",
+                                       np.char.zfill(point_ids.astype(str), 4))
+            
+            # Create DataFrame from column arrays; metadata scalars broadcast
+            # to constant columns
+            df = pd.DataFrame({
+                "sample_name": sample_names,
+                "longitude": coords[:, 0],
+                "latitude": coords[:, 1],
+                "point_id": point_ids,
+                **{f"metadata_{key}": value for key, value in (metadata or {}).items()}
+            })
+            
             # Export to CSV
-            df.to_csv(output_path, index=False)
+            if use_pyarrow and PYARROW_AVAILABLE:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pacsv.write_csv(table, str(output_path))
+            else:
+                if use_pyarrow:
+                    logger.warning("pyarrow is not installed, falling back to pandas CSV writer")
+                df.to_csv(output_path, index=False)
             
             logger.info(f"Exported {len(points)} points to {output_path}")
             return True
@@ -141,12 +207,6 @@ class SamplingPointExporter:
         except Exception as e:
             logger.error(f"Error exporting to CSV: {str(e)}")
             return False
-    
-
-    
-
-    
-
 
 def export_sampling_points(points: List[Point], output_path: str,
                           format: str = "csv", **kwargs) -> bool:
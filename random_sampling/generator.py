@@ -1,14 +1,558 @@
 """
 Random point generator for creating sampling points inside polygon boundaries.
 """
-from typing import List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, List, Tuple, Optional, Union
+import math
+import multiprocessing
+import os
 import numpy as np
+import shapely
+import shapely.wkb
 from shapely.geometry import Point, Polygon
-from .boundary import BoundaryHandler
+from shapely.ops import triangulate
+from .boundary import BoundaryHandler, NUMBA_AVAILABLE
 import logging
 
+if NUMBA_AVAILABLE:
+    from numba import njit
+
 logger = logging.getLogger(__name__)
 
+# Candidates drawn per vectorized containment test
+_CANDIDATE_BATCH_SIZE = 4096
+
+# Process pool startup (each spawned worker spends ~1 s re-importing the
+# package) costs more than it saves below this many polygons or total
+# requested points; the serial Python sampler manages ~150k points/s
+_PARALLEL_MIN_POLYGONS = 4
+_PARALLEL_MIN_POINTS = 500_000
+
+# Largest dense grid (int32 cells) the numba sampler allocates; very small
+# min_distance over large bounds falls back to the sparse Python grid
+_NUMBA_MAX_GRID_CELLS = 1 << 24
+
+# Dart throwing (random sequential adsorption) saturates once disks of
+# diameter min_distance cover ~54.7% of the area
+_RSA_JAMMING_DENSITY = 0.547
+
+# A sampler gives up after this many consecutive distance rejections, or
+# 1% of its attempt budget if larger; a short window stops well before
+# saturation on tight but feasible requests
+_MIN_STALL_REJECTIONS = 512
+
+# Points per axis of the lattice used to estimate a variable radius's range
+_RADIUS_PROBE_SIZE = 32
+
+# Variable-radius cells are at least this fraction of the largest probed
+# radius, bounding how many cells one accepted point is registered in
+_MIN_RADIUS_RATIO = 1 / 16
+
+# Polygons filling less than this share of their bounding box draw candidates
+# from a triangulation instead of the box
+_TRIANGLE_FILL_RATIO = 0.5
+
+def _triangulate(geometry) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Triangulate a geometry's vertices into triangles that cover it.
+    
+    Delaunay triangles span the convex hull, so triangles that miss or only
+    touch the geometry are dropped; the rest still cover it completely.
+    
+    Args:
+        geometry: Polygon or MultiPolygon to cover
+        
+    Returns:
+        Tuple: ((T, 3, 2) triangle vertices, (T,) cumulative triangle areas)
+    """
+    triangles = np.array(triangulate(geometry), dtype=object)
+    if len(triangles) == 0:
+        return np.empty((0, 3, 2), dtype=np.float64), np.empty(0, dtype=np.float64)
+        
+    keep = shapely.intersects(triangles, geometry) & ~shapely.touches(triangles, geometry)
+    triangles = triangles[keep]
+    vertices = shapely.get_coordinates(shapely.get_exterior_ring(triangles)).reshape(-1, 4, 2)[:, :3]
+    return np.ascontiguousarray(vertices), np.cumsum(shapely.area(triangles))
+
+def _candidate_triangles(geometry) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Get triangles to draw candidates from when the bounding box fits poorly.
+    
+    Args:
+        geometry: Polygon or MultiPolygon being sampled
+        
+    Returns:
+        Optional[Tuple]: Output of _triangulate, or None to draw from the bounds
+    """
+    minx, miny, maxx, maxy = geometry.bounds
+    bounds_area = (maxx - minx) * (maxy - miny)
+    if bounds_area <= 0 or geometry.area >= _TRIANGLE_FILL_RATIO * bounds_area:
+        return None
+        
+    try:
+        vertices, cumulative_areas = _triangulate(geometry)
+    except Exception as e:
+        logger.warning(f"Could not triangulate boundary, sampling its bounds instead: {str(e)}")
+        return None
+        
+    if len(vertices) == 0 or cumulative_areas[-1] >= bounds_area:
+        return None
+    return vertices, cumulative_areas
+
+def _draw_in_triangles(vertices: np.ndarray, cumulative_areas: np.ndarray, n: int,
+                       rng: np.random.Generator) -> np.ndarray:
+    """
+    Draw points uniformly over a set of triangles.
+    
+    Args:
+        vertices: (T, 3, 2) triangle vertices
+        cumulative_areas: (T,) cumulative triangle areas
+        n: Number of points to draw
+        rng: Random number generator
+        
+    Returns:
+        np.ndarray: (n, 2) array of coordinates
+    """
+    # Pick triangles in proportion to area, then fold the unit square onto
+    # the unit triangle so barycentric coordinates stay uniform
+    idx = np.searchsorted(cumulative_areas, rng.uniform(0, cumulative_areas[-1], n), side="right")
+    np.minimum(idx, len(cumulative_areas) - 1, out=idx)
+    u = rng.random((n, 2))
+    flip = u.sum(axis=1) > 1
+    u[flip] = 1 - u[flip]
+    a = vertices[idx, 0]
+    return a + u[:, :1] * (vertices[idx, 1] - a) + u[:, 1:] * (vertices[idx, 2] - a)
+
+def _sample_uniform_in_polygon(geometry, n_points: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Generate points uniformly inside a geometry without a distance constraint.
+    
+    Args:
+        geometry: Polygon or MultiPolygon to sample
+        n_points: Number of points to generate
+        rng: Random number generator
+        
+    Returns:
+        np.ndarray: (N, 2) array of coordinates
+    """
+    accepted = np.empty((n_points, 2), dtype=np.float64)
+    vertices, cumulative_areas = _triangulate(geometry)
+    if len(vertices) == 0:
+        return accepted[:0]
+        
+    count = 0
+    while count < n_points:
+        candidates = _draw_in_triangles(
+            vertices, cumulative_areas, min(_CANDIDATE_BATCH_SIZE, n_points - count), rng
+        )
+        # Triangles of a concave or holed geometry can overhang it
+        inside = candidates[shapely.contains_xy(geometry, candidates[:, 0], candidates[:, 1])]
+        inside = inside[:n_points - count]
+        accepted[count:count + len(inside)] = inside
+        count += len(inside)
+        
+    return accepted
+
+def _stall_limit(max_attempts: int) -> int:
+    """Consecutive distance rejections after which a sampler stops early."""
+    return max(_MIN_STALL_REJECTIONS, max_attempts // 100)
+
+def _cap_to_packing_limit(n_points: int, area: float, perimeter: float,
+                          min_distance: float) -> int:
+    """
+    Cap a requested point count at what dart throwing can fit in an area.
+    
+    Centres lie inside the boundary but their exclusion disks may overhang
+    it, so the area is grown by a min_distance / 2 margin before applying
+    the jamming density.
+    
+    Args:
+        n_points: Requested number of points
+        area: Boundary area
+        perimeter: Boundary perimeter
+        min_distance: Minimum distance between points
+        
+    Returns:
+        int: n_points, or the packing limit if that is smaller
+    """
+    radius = min_distance / 2
+    disk_area = math.pi * radius * radius
+    limit = max(1, int(_RSA_JAMMING_DENSITY * (area + perimeter * radius + disk_area) / disk_area))
+    if n_points > limit:
+        logger.warning(f"Requested {n_points} points but only about {limit} fit with "
+                       f"minimum distance {min_distance}; capping to {limit}")
+        return limit
+    return n_points
+
+def _bridson_sample(bounds: Tuple[float, float, float, float], min_distance: float,
+                    n_points: int, contains: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                    rng: np.random.Generator, max_attempts: int,
+                    triangles: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, int]:
+    """
+    Poisson-disk sampling using Bridson's background grid for distance checks.
+    
+    Candidates are drawn uniformly over the bounds rather than grown outward
+    from an active list, so a run capped at n_points stays spread over the whole
+    polygon instead of clustering around the first sample. Grid cells have side
+    min_distance / sqrt(2), so each holds at most one accepted point and a
+    candidate only needs to be compared against the surrounding 5x5 cells.
+    The run stops early once _stall_limit(max_attempts) candidates in a row
+    fail the distance test, since the boundary is then close to saturated.
+    
+    Args:
+        bounds: (minx, miny, maxx, maxy) to draw candidates from
+        min_distance: Minimum distance between points
+        n_points: Number of points to generate
+        contains: Batched containment test returning a boolean mask for (xs, ys)
+        rng: Random number generator for candidate coordinates
+        max_attempts: Maximum number of candidates to draw
+        triangles: Triangles to draw candidates from instead of the bounds (optional)
+        
+    Returns:
+        Tuple: ((N, 2) array of accepted coordinates, number of attempts)
+    """
+    # Plain floats: numpy scalars here would make every grid lookup in the
+    # loop below go through numpy's slower scalar arithmetic
+    minx, miny, maxx, maxy = map(float, bounds)
+    cell_size = min_distance / math.sqrt(2)
+    min_distance_sq = min_distance * min_distance
+    
+    # Sparse grid: (column, row) -> accepted (x, y) as Python floats, so the
+    # squared-distance test never touches numpy scalars; memory stays
+    # proportional to the accepted points even for tiny min_distance
+    grid = {}
+    accepted = np.empty((n_points, 2), dtype=np.float64)
+    count = 0
+    attempts = 0
+    stall_limit = _stall_limit(max_attempts)
+    rejections = 0
+    
+    while count < n_points and attempts < max_attempts and rejections < stall_limit:
+        # Draw a batch of candidates and test containment in a single call
+        batch_size = min(_CANDIDATE_BATCH_SIZE, max_attempts - attempts)
+        if triangles is None:
+            candidates = rng.uniform((minx, miny), (maxx, maxy), size=(batch_size, 2))
+        else:
+            candidates = _draw_in_triangles(*triangles, batch_size, rng)
+        xs = candidates[:, 0]
+        ys = candidates[:, 1]
+        inside = np.flatnonzero(contains(xs, ys))
+        attempts += batch_size
+        
+        for idx in inside:
+            x = float(xs[idx])
+            y = float(ys[idx])
+            
+            # Check minimum distance against points in the neighbouring cells
+            gx = int((x - minx) / cell_size)
+            gy = int((y - miny) / cell_size)
+            too_close = False
+            for i in range(gx - 2, gx + 3):
+                for j in range(gy - 2, gy + 3):
+                    neighbour = grid.get((i, j))
+                    if neighbour is not None:
+                        dx = neighbour[0] - x
+                        dy = neighbour[1] - y
+                        if dx * dx + dy * dy < min_distance_sq:
+                            too_close = True
+                            break
+                if too_close:
+                    break
+            if too_close:
+                rejections += 1
+                if rejections == stall_limit:
+                    # Saturated: candidates after this one were never needed
+                    attempts -= batch_size - idx - 1
+                    break
+                continue
+                
+            grid[(gx, gy)] = (x, y)
+            accepted[count] = (x, y)
+            count += 1
+            rejections = 0
+            if count == n_points:
+                # Candidates after this one were never needed
+                attempts -= batch_size - idx - 1
+                break
+                
+    return accepted[:count], attempts
+
+def _bridson_sample_variable(bounds: Tuple[float, float, float, float],
+                             radius: Callable[[float, float], float], n_points: int,
+                             contains: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                             rng: np.random.Generator, max_attempts: int,
+                             triangles: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, int]:
+    """
+    Variable-density variant of _bridson_sample with a radius per point.
+    
+    Every accepted point keeps its own radius r_i = radius(x, y), and two
+    points conflict when closer than max(r_i, r_j). That test is split in
+    two: accepted points within the candidate's radius are found around its
+    own cell, and accepted points whose radius covers the candidate are found
+    in its cell's cover list, where each point is registered in every cell
+    its radius reaches. Cells are sized from the smallest radius found on a
+    coarse lattice over the bounds (floored at a fraction of the largest) and
+    hold lists, so a radius below the cell size only costs speed.
+    
+    Args:
+        bounds: (minx, miny, maxx, maxy) to draw candidates from
+        radius: Minimum distance as a function of (x, y)
+        n_points: Number of points to generate
+        contains: Batched containment test returning a boolean mask for (xs, ys)
+        rng: Random number generator for candidate coordinates
+        max_attempts: Maximum number of candidates to draw
+        triangles: Triangles to draw candidates from instead of the bounds (optional)
+        
+    Returns:
+        Tuple: ((N, 2) array of accepted coordinates, number of attempts)
+    """
+    minx, miny, maxx, maxy = map(float, bounds)
+    probe_x, probe_y = np.meshgrid(np.linspace(minx, maxx, _RADIUS_PROBE_SIZE),
+                                   np.linspace(miny, maxy, _RADIUS_PROBE_SIZE))
+    probe = [radius(float(x), float(y)) for x, y in zip(probe_x.ravel(), probe_y.ravel())]
+    positive = [r for r in probe if r > 0]
+    if positive:
+        cell_size = max(min(positive), max(positive) * _MIN_RADIUS_RATIO) / math.sqrt(2)
+    else:
+        cell_size = max(maxx - minx, maxy - miny, 1.0) / math.sqrt(2)
+    
+    # Sparse grids: (column, row) -> accepted (x, y) centred in the cell, and
+    # (column, row) -> accepted (x, y, r) whose radius reaches the cell
+    centres = {}
+    cover = {}
+    accepted = np.empty((n_points, 2), dtype=np.float64)
+    count = 0
+    attempts = 0
+    stall_limit = _stall_limit(max_attempts)
+    rejections = 0
+    
+    while count < n_points and attempts < max_attempts and rejections < stall_limit:
+        batch_size = min(_CANDIDATE_BATCH_SIZE, max_attempts - attempts)
+        if triangles is None:
+            candidates = rng.uniform((minx, miny), (maxx, maxy), size=(batch_size, 2))
+        else:
+            candidates = _draw_in_triangles(*triangles, batch_size, rng)
+        xs = candidates[:, 0]
+        ys = candidates[:, 1]
+        inside = np.flatnonzero(contains(xs, ys))
+        attempts += batch_size
+        
+        for idx in inside:
+            x = float(xs[idx])
+            y = float(ys[idx])
+            r = float(radius(x, y))
+            r_sq = r * r
+            gx = int((x - minx) / cell_size)
+            gy = int((y - miny) / cell_size)
+            
+            # Accepted points whose own radius covers the candidate
+            too_close = False
+            for px, py, pr in cover.get((gx, gy), ()):
+                dx = px - x
+                dy = py - y
+                if dx * dx + dy * dy < pr * pr:
+                    too_close = True
+                    break
+                    
+            # Accepted points inside the candidate's radius
+            if not too_close:
+                reach = int(math.ceil(r / cell_size))
+                for i in range(gx - reach, gx + reach + 1):
+                    for j in range(gy - reach, gy + reach + 1):
+                        for px, py in centres.get((i, j), ()):
+                            dx = px - x
+                            dy = py - y
+                            if dx * dx + dy * dy < r_sq:
+                                too_close = True
+                                break
+                        if too_close:
+                            break
+                    if too_close:
+                        break
+                        
+            if too_close:
+                rejections += 1
+                if rejections == stall_limit:
+                    attempts -= batch_size - idx - 1
+                    break
+                continue
+                
+            centres.setdefault((gx, gy), []).append((x, y))
+            for i in range(int((x - r - minx) / cell_size), int((x + r - minx) / cell_size) + 1):
+                for j in range(int((y - r - miny) / cell_size), int((y + r - miny) / cell_size) + 1):
+                    cover.setdefault((i, j), []).append((x, y, r))
+            accepted[count] = (x, y)
+            count += 1
+            rejections = 0
+            if count == n_points:
+                attempts -= batch_size - idx - 1
+                break
+                
+    return accepted[:count], attempts
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _point_in_rings(x, y, ring_xy, ring_offsets):
+        """Even-odd ray-casting test against every ring of one polygon."""
+        inside = False
+        for r in range(ring_offsets.shape[0] - 1):
+            start = ring_offsets[r]
+            end = ring_offsets[r + 1]
+            j = end - 1
+            for k in range(start, end):
+                xk = ring_xy[k, 0]
+                yk = ring_xy[k, 1]
+                xj = ring_xy[j, 0]
+                yj = ring_xy[j, 1]
+                if (yk > y) != (yj > y):
+                    if x < (xj - xk) * (y - yk) / (yj - yk) + xk:
+                        inside = not inside
+                j = k
+        return inside
+
+    @njit(cache=True)
+    def _bridson_nb(ring_xy, ring_offsets, tri_xy, tri_cumulative_areas, minx, miny, maxx, maxy,
+                    min_distance, n_points, max_attempts, stall_limit, seed):
+        """Compiled counterpart of _bridson_sample for a single polygon."""
+        np.random.seed(seed)
+        cell_size = min_distance / np.sqrt(2.0)
+        min_distance_sq = min_distance * min_distance
+        nx = int((maxx - minx) / cell_size) + 1
+        ny = int((maxy - miny) / cell_size) + 1
+        grid = np.full((nx, ny), -1, dtype=np.int32)
+        accepted = np.empty((n_points, 2), dtype=np.float64)
+        n_triangles = tri_xy.shape[0]
+        count = 0
+        attempts = 0
+        rejections = 0
+        
+        while count < n_points and attempts < max_attempts and rejections < stall_limit:
+            attempts += 1
+            if n_triangles > 0:
+                t = min(np.searchsorted(tri_cumulative_areas,
+                                        np.random.random() * tri_cumulative_areas[-1],
+                                        side="right"), n_triangles - 1)
+                u = np.random.random()
+                v = np.random.random()
+                if u + v > 1.0:
+                    u = 1.0 - u
+                    v = 1.0 - v
+                x = tri_xy[t, 0, 0] + u * (tri_xy[t, 1, 0] - tri_xy[t, 0, 0]) + v * (tri_xy[t, 2, 0] - tri_xy[t, 0, 0])
+                y = tri_xy[t, 0, 1] + u * (tri_xy[t, 1, 1] - tri_xy[t, 0, 1]) + v * (tri_xy[t, 2, 1] - tri_xy[t, 0, 1])
+                x = min(max(x, minx), maxx)
+                y = min(max(y, miny), maxy)
+            else:
+                x = np.random.uniform(minx, maxx)
+                y = np.random.uniform(miny, maxy)
+            gx = min(int((x - minx) / cell_size), nx - 1)
+            gy = min(int((y - miny) / cell_size), ny - 1)
+            
+            # Containment first, as in the Python samplers, so only candidates
+            # inside the polygon count towards the stall limit
+            if not _point_in_rings(x, y, ring_xy, ring_offsets):
+                continue
+                
+            # Distance check over the surrounding 5x5 cells
+            too_close = False
+            for i in range(max(gx - 2, 0), min(gx + 3, nx)):
+                for j in range(max(gy - 2, 0), min(gy + 3, ny)):
+                    k = grid[i, j]
+                    if k >= 0:
+                        dx = accepted[k, 0] - x
+                        dy = accepted[k, 1] - y
+                        if dx * dx + dy * dy < min_distance_sq:
+                            too_close = True
+                            break
+                if too_close:
+                    break
+            if too_close:
+                rejections += 1
+                continue
+                
+            grid[gx, gy] = count
+            accepted[count, 0] = x
+            accepted[count, 1] = y
+            count += 1
+            rejections = 0
+            
+        return accepted[:count], attempts
+
+def _uses_compiled_sampler(bounds: Tuple[float, float, float, float], min_distance: float) -> bool:
+    """Whether _sample_polygon will run the numba kernel for these bounds."""
+    if not NUMBA_AVAILABLE:
+        return False
+    minx, miny, maxx, maxy = bounds
+    cell_size = min_distance / math.sqrt(2)
+    grid_cells = (int((maxx - minx) / cell_size) + 1) * (int((maxy - miny) / cell_size) + 1)
+    return grid_cells <= _NUMBA_MAX_GRID_CELLS
+
+def _sample_polygon(rings: List[np.ndarray], bounds: Tuple[float, float, float, float],
+                    min_distance: float, n_points: int,
+                    contains: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                    rng: np.random.Generator, max_attempts: int,
+                    triangles: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Tuple[np.ndarray, int]:
+    """
+    Sample a single polygon, using the compiled sampler when numba is available.
+    
+    Args:
+        rings: Ring vertex arrays of the polygon (exterior first, then holes)
+        bounds: (minx, miny, maxx, maxy) of the polygon
+        min_distance: Minimum distance between points
+        n_points: Number of points to generate
+        contains: Batched containment test used by the Python fallback
+        rng: Random number generator (seeds the compiled sampler)
+        max_attempts: Maximum number of candidates to draw
+        triangles: Triangles to draw candidates from instead of the bounds (optional)
+        
+    Returns:
+        Tuple: ((N, 2) array of accepted coordinates, number of attempts)
+    """
+    minx, miny, maxx, maxy = bounds
+    if _uses_compiled_sampler(bounds, min_distance):
+        ring_xy = np.ascontiguousarray(np.concatenate(rings))
+        ring_offsets = np.concatenate(([0], np.cumsum([len(ring) for ring in rings])))
+        if triangles is None:
+            triangles = (np.empty((0, 3, 2), dtype=np.float64), np.empty(0, dtype=np.float64))
+        seed = int(rng.integers(2**31 - 1))
+        return _bridson_nb(ring_xy, ring_offsets.astype(np.int64), triangles[0], triangles[1],
+                           float(minx), float(miny), float(maxx), float(maxy),
+                           float(min_distance), int(n_points), int(max_attempts),
+                           _stall_limit(max_attempts), seed)
+        
+    return _bridson_sample(bounds, min_distance, n_points, contains, rng, max_attempts, triangles)
+
+def _sample_polygon_worker(polygon_wkb: bytes, n_points: int, min_distance: float,
+                           seed: Optional[int]) -> Tuple[np.ndarray, int]:
+    """
+    Sample one polygon in a worker process.
+    
+    Args:
+        polygon_wkb: Polygon serialized as WKB
+        n_points: Number of points to generate
+        min_distance: Minimum distance between points in boundary CRS units
+        seed: Random seed for this polygon (optional)
+        
+    Returns:
+        Tuple: ((N, 2) array of accepted coordinates, number of attempts)
+    """
+    polygon = shapely.wkb.loads(polygon_wkb)
+    handler = BoundaryHandler([polygon], _skip_validate=True)
+    rng = np.random.default_rng(seed)
+    return _sample_polygon(handler.get_polygon_rings(0), polygon.bounds, min_distance, n_points,
+                           handler.contains_points_fast, rng, n_points * 1000,
+                           _candidate_triangles(polygon))
+
+def _log_sample_result(accepted_xy: np.ndarray, attempts: int, n_points: int,
+                       min_distance: Union[float, Callable[[float, float], float]]) -> None:
+    """Log how many points a sampler run produced."""
+    if callable(min_distance):
+        min_distance = "(variable)"
+    if len(accepted_xy) < n_points:
+        logger.warning(f"Could only generate {len(accepted_xy)} points with minimum distance {min_distance}")
+        
+    logger.info(f"Generated {len(accepted_xy)} random points with minimum distance in {attempts} attempts")
+
 class RandomPointGenerator:
     """Generate random sampling points inside polygon boundaries."""
     
@@ -25,69 +569,106 @@ class RandomPointGenerator:
         if not self.bounds:
             raise ValueError("No valid boundary available for point generation")
     
-
+    def _sample(self, contains: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                bounds: Tuple[float, float, float, float], n_points: int,
+                min_distance: Union[float, Callable[[float, float], float]],
+                rng: np.random.Generator, rings: Optional[List[np.ndarray]] = None,
+                triangles: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> np.ndarray:
+        """
+        Run the grid sampler for one containment test and log the outcome.
+        
+        Args:
+            contains: Batched containment test returning a boolean mask for (xs, ys)
+            bounds: (minx, miny, maxx, maxy) to draw candidates from
+            n_points: Number of points to generate
+            min_distance: Minimum distance between points in boundary CRS units,
+                or a function of (x, y) for variable density
+            rng: Random number generator for candidate coordinates
+            rings: Ring vertices when sampling a single polygon, enabling the
+                compiled sampler (optional)
+            triangles: Triangles to draw candidates from instead of the bounds (optional)
+            
+        Returns:
+            np.ndarray: (N, 2) array of accepted coordinates
+        """
+        max_attempts = n_points * 1000  # Higher limit for distance constraint
+        if callable(min_distance):
+            accepted_xy, attempts = _bridson_sample_variable(
+                bounds, min_distance, n_points, contains, rng, max_attempts, triangles
+            )
+        elif rings is not None:
+            accepted_xy, attempts = _sample_polygon(
+                rings, bounds, min_distance, n_points, contains, rng, max_attempts, triangles
+            )
+        else:
+            accepted_xy, attempts = _bridson_sample(
+                bounds, min_distance, n_points, contains, rng, max_attempts, triangles
+            )
+        _log_sample_result(accepted_xy, attempts, n_points, min_distance)
+        return accepted_xy
     
-    def generate_points_with_minimum_distance(self, n_points: int, min_distance: float, 
+    def generate_points_with_minimum_distance(self, n_points: int,
+                                           min_distance: Union[float, Callable[[float, float], float]],
                                            seed: Optional[int] = None) -> List[Point]:
         """
         Generate random points with minimum distance between them.
         
         Args:
             n_points: Number of points to generate
-            min_distance: Minimum distance between points in degrees
+            min_distance: Minimum distance between points in boundary CRS units, or a
+                function of (x, y) giving a spatially varying distance; two points
+                must then be at least the larger of their two distances apart
             seed: Random seed for reproducibility
             
         Returns:
             List[Point]: List of shapely Point objects
         """
-        if seed is not None:
-            np.random.seed(seed)
-            
         if n_points <= 0:
             logger.warning("Number of points must be positive")
             return []
             
-        if min_distance <= 0:
-            logger.warning("Minimum distance must be positive")
-            return self.generate_points(n_points, seed)
-            
-        points = []
-        attempts = 0
-        max_attempts = n_points * 1000  # Higher limit for distance constraint
-        
-        while len(points) < n_points and attempts < max_attempts:
-            # Generate random point within bounding box
-            x = np.random.uniform(self.bounds[0], self.bounds[2])
-            y = np.random.uniform(self.bounds[1], self.bounds[3])
-            
-            point = Point(x, y)
-            
-            # Check if point is inside boundary
-            if not self.boundary_handler.contains_point(point):
-                attempts += 1
-                continue
-                
-            # Check minimum distance from existing points
-            too_close = False
-            for existing_point in points:
-                distance = point.distance(existing_point)
-                if distance < min_distance:
-                    too_close = True
-                    break
-                    
-            if not too_close:
-                points.append(point)
+        if not callable(min_distance):
+            if min_distance <= 0:
+                logger.warning("Minimum distance must be positive")
+                return self.generate_points(n_points, seed)
                 
-            attempts += 1
+            perimeter = sum(polygon.length for polygon in self.boundary_handler.polygons)
+            n_points = _cap_to_packing_limit(
+                n_points, self.boundary_handler.get_area(), perimeter, min_distance
+            )
+        
+        rng = np.random.default_rng(seed)
+        triangles = _candidate_triangles(self.boundary_handler.get_combined_boundary())
+        accepted_xy = self._sample(
+            self.boundary_handler.contains_points_fast, self.bounds, n_points, min_distance, rng,
+            triangles=triangles
+        )
+        
+        # Build all Point geometries in a single vectorized call
+        return list(shapely.points(accepted_xy))
+    
+    def generate_points(self, n_points: int, seed: Optional[int] = None) -> List[Point]:
+        """
+        Generate uniformly distributed random points without a distance constraint.
+        
+        Args:
+            n_points: Number of points to generate
+            seed: Random seed for reproducibility
             
-        if len(points) < n_points:
-            logger.warning(f"Could only generate {len(points)} points with minimum distance {min_distance}")
+        Returns:
+            List[Point]: List of shapely Point objects
+        """
+        if n_points <= 0:
+            logger.warning("Number of points must be positive")
+            return []
             
-        logger.info(f"Generated {len(points)} random points with minimum distance in {attempts} attempts")
-        return points
+        rng = np.random.default_rng(seed)
+        accepted_xy = _sample_uniform_in_polygon(
+            self.boundary_handler.get_combined_boundary(), n_points, rng
+        )
+        logger.info(f"Generated {len(accepted_xy)} random points")
+        return list(shapely.points(accepted_xy))
     
-
-
     def generate_points_per_polygon(self, n_points_per_polygon: int, 
                                   seed: Optional[int] = None, **kwargs) -> List[Point]:
         """
@@ -96,41 +677,130 @@ class RandomPointGenerator:
         Args:
             n_points_per_polygon: Number of points to generate per polygon
             seed: Random seed for reproducibility
-            **kwargs: Additional arguments (min_distance required)
+            **kwargs: Additional arguments (min_distance required, either a number
+                or a function of (x, y); parallel=True samples polygons in a process
+                pool, which requires the caller's script to be import-safe)
             
         Returns:
             List[Point]: List of shapely Point objects
         """
-        all_points = []
+        accepted_xy = self.generate_points_per_polygon_array(n_points_per_polygon, seed=seed, **kwargs)
+        return list(shapely.points(accepted_xy))
+    
+    def generate_points_per_polygon_array(self, n_points_per_polygon: int,
+                                          seed: Optional[int] = None, **kwargs) -> np.ndarray:
+        """
+        Generate points for each polygon as raw coordinates.
+        
+        Same sampling as generate_points_per_polygon, without building Point objects.
+        
+        Args:
+            n_points_per_polygon: Number of points to generate per polygon
+            seed: Random seed for reproducibility
+            **kwargs: Additional arguments (min_distance required, either a number
+                or a function of (x, y); parallel=True samples polygons in a process
+                pool, which requires the caller's script to be import-safe)
+            
+        Returns:
+            np.ndarray: (N, 2) array of coordinates, grouped by polygon in order
+        """
+        empty = np.empty((0, 2), dtype=np.float64)
         
         if not self.boundary_handler.polygons:
             logger.warning("No polygons available for per-polygon sampling")
-            return []
+            return empty
+            
+        if n_points_per_polygon <= 0:
+            logger.warning("Number of points must be positive")
+            return empty
+            
+        min_distance = kwargs.get("min_distance", 0.001)
+        variable = callable(min_distance)
+        # Without a positive distance, sample each polygon uniformly, as
+        # generate_points_with_minimum_distance does for the combined boundary
+        uniform = not variable and min_distance <= 0
+        if uniform:
+            logger.warning("Minimum distance must be positive")
         
         logger.info(f"Generating {n_points_per_polygon} points per polygon for {len(self.boundary_handler.polygons)} polygons")
         
-        for i, polygon in enumerate(self.boundary_handler.polygons):
+        polygons = self.boundary_handler.polygons
+        
+        # Use a unique seed for each polygon if a base seed is provided
+        polygon_seeds = [seed + i if seed is not None else None for i in range(len(polygons))]
+        
+        # Don't spend the attempt budget chasing more points than can fit; there
+        # is no closed-form packing limit for a variable distance
+        polygon_targets = [
+            n_points_per_polygon if variable or uniform else
+            _cap_to_packing_limit(n_points_per_polygon, polygon.area, polygon.length, min_distance)
+            for polygon in polygons
+        ]
+        
+        # Per-polygon bounds are computed once; containment is restricted to
+        # one polygon by index instead of building a handler per polygon
+        polygon_bounds = self.boundary_handler.get_polygon_bounds()
+        
+        # Polygons are independent, so sample them in worker processes. Only
+        # worth it for the pure-Python sampler: the compiled one finishes long
+        # before spawned workers have imported the package and numba. A
+        # variable distance stays in-process since callables such as lambdas
+        # cannot be sent to spawned workers. Opt-in: spawned workers re-run the
+        # caller's __main__ module, so scripts need an import guard
+        results = None
+        if (kwargs.get("parallel", False) and not variable and not uniform
+                and len(polygons) >= _PARALLEL_MIN_POLYGONS
+                and sum(polygon_targets) >= _PARALLEL_MIN_POINTS
+                and (os.cpu_count() or 1) > 1
+                and not all(_uses_compiled_sampler(tuple(bounds.tolist()), min_distance)
+                            for bounds in polygon_bounds)):
             try:
-                # Create a boundary handler for this single polygon
-                single_polygon_handler = BoundaryHandler([polygon])
-                single_generator = RandomPointGenerator(single_polygon_handler)
-                
-                # Use a unique seed for each polygon if a base seed is provided
-                polygon_seed = seed + i if seed is not None else None
-                
-                # Generate points for this polygon with minimum distance
-                polygon_points = single_generator.generate_points_with_minimum_distance(
-                    n_points_per_polygon, kwargs.get("min_distance", 0.001), polygon_seed
-                )
+                # Spawn rather than fork: numba's threading layer is already
+                # initialised in this process and is not fork-safe
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(mp_context=context) as executor:
+                    futures = [
+                        executor.submit(_sample_polygon_worker, polygon.wkb,
+                                        polygon_targets[i], min_distance, polygon_seeds[i])
+                        for i, polygon in enumerate(polygons)
+                    ]
+                    results = [future.result() for future in futures]
+            except Exception as e:
+                logger.warning(f"Parallel sampling failed, falling back to serial: {str(e)}")
+                results = None
+        
+        # Each polygon writes its accepted coordinates into one shared buffer
+        result = np.empty((sum(polygon_targets), 2), dtype=np.float64)
+        count = 0
+        
+        for i in range(len(polygons)):
+            try:
+                if results is not None:
+                    polygon_xy, attempts = results[i]
+                    _log_sample_result(polygon_xy, attempts, polygon_targets[i], min_distance)
+                elif uniform:
+                    rng = np.random.default_rng(polygon_seeds[i])
+                    polygon_xy = _sample_uniform_in_polygon(polygons[i], polygon_targets[i], rng)
+                else:
+                    rng = np.random.default_rng(polygon_seeds[i])
+                    contains = partial(self.boundary_handler.contains_points_fast, index=i)
+                    
+                    # Generate points for this polygon with minimum distance
+                    polygon_xy = self._sample(
+                        contains, tuple(polygon_bounds[i].tolist()), polygon_targets[i], min_distance, rng,
+                        rings=self.boundary_handler.get_polygon_rings(i),
+                        triangles=_candidate_triangles(polygons[i])
+                    )
                 
-                all_points.extend(polygon_points)
-                logger.info(f"Generated {len(polygon_points)} points for polygon {i+1}")
+                result[count:count + len(polygon_xy)] = polygon_xy
+                count += len(polygon_xy)
+                logger.info(f"Generated {len(polygon_xy)} points for polygon {i+1}")
                 
             except Exception as e:
                 logger.error(f"Error generating points for polygon {i}: {str(e)}")
         
-        logger.info(f"Total points generated across all polygons: {len(all_points)}")
-        return all_points
+        logger.info(f"Total points generated across all polygons: {count}")
+        return result[:count]
 
 def generate_sampling_points(boundary_handler: BoundaryHandler, n_points: int,
                            method: str = "min_distance", per_polygon: bool = True, **kwargs) -> List[Point]:
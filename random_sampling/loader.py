@@ -4,26 +4,63 @@ KML file loader for parsing polygon boundaries using lxml.
 from pathlib import Path
 from typing import List, Tuple, Optional
 from lxml import etree
+import numpy as np
+import shapely
 from shapely.geometry import Polygon
 import logging
+import warnings
 
 logger = logging.getLogger(__name__)
 
+_KML_NAMESPACE = 'http://www.opengis.net/kml/2.2'
+_KML_NS = {'kml': _KML_NAMESPACE}
+_PLACEMARK_TAG = f'{{{_KML_NAMESPACE}}}Placemark'
+# Placemark child elements copied into the attribute dict, in output order
+_ATTRIBUTE_TAGS = {
+    f'{{{_KML_NAMESPACE}}}name': 'name',
+    f'{{{_KML_NAMESPACE}}}styleUrl': 'styleUrl',
+    f'{{{_KML_NAMESPACE}}}description': 'description',
+}
+_EXTENDED_DATA_TAG = f'{{{_KML_NAMESPACE}}}ExtendedData'
+_DATA_TAG = f'{{{_KML_NAMESPACE}}}Data'
+
+# Compiled once rather than re-parsed on every placemark
+_XP_OUTER_COORDINATES = etree.XPath('.//kml:outerBoundaryIs//kml:coordinates', namespaces=_KML_NS)
+_XP_COORDINATES = etree.XPath('.//kml:coordinates', namespaces=_KML_NS)
+
 class KMLLoader:
     """Load and parse KML files to extract polygon boundaries using lxml."""
     
     def __init__(self):
-        self.kml_doc = None
+        self.kml_path = None
+        self._kml_doc = None
+        
+    @property
+    def kml_doc(self):
+        """
+        Fully parsed document tree of the loaded KML file, or None.
+        
+        Kept for callers of the pre-streaming API; extraction streams the file
+        instead, so the tree is only parsed when this is first accessed.
+        """
+        if self._kml_doc is None and self.kml_path:
+            parser = etree.XMLParser(remove_blank_text=True)
+            self._kml_doc = etree.parse(self.kml_path, parser)
+        return self._kml_doc
         
     def load_kml(self, file_path: str) -> bool:
         """
         Load a KML file from the given path.
         
+        The document itself is streamed when polygons are extracted, so only
+        its root element is parsed here to reject missing, non-XML and
+        non-KML files up front.
+        
         Args:
             file_path: Path to the KML file
             
         Returns:
-            bool: True if successfully loaded, False otherwise
+            bool: True if the file exists and has a kml root element, False otherwise
         """
         try:
             kml_path = Path(file_path)
@@ -31,13 +68,22 @@ class KMLLoader:
                 logger.error(f"KML file not found: {file_path}")
                 return False
                 
-            # Parse KML with lxml
-            parser = etree.XMLParser(remove_blank_text=True)
-            self.kml_doc = etree.parse(str(kml_path), parser)
+            # Stop at the first start event rather than parsing the whole file
+            _, root = next(iter(etree.iterparse(str(kml_path), events=('start',))))
+            if etree.QName(root).localname != 'kml':
+                logger.error(f"Not a KML document (root element is <{etree.QName(root).localname}>): {file_path}")
+                return False
+                
+            self.kml_path = str(kml_path)
+            self._kml_doc = None
             
             logger.info(f"Successfully loaded KML file: {file_path}")
             return True
             
+        except etree.XMLSyntaxError as e:
+            logger.error(f"Malformed KML file {file_path}: {str(e)}")
+            return False
+            
         except Exception as e:
             logger.error(f"Error loading KML file {file_path}: {str(e)}")
             return False
@@ -45,42 +91,73 @@ class KMLLoader:
     def extract_polygons_with_attributes(self) -> List[Tuple[Polygon, dict]]:
         """Extract all polygons with their KML attributes from the loaded KML document."""
         polygons_with_attrs = []
-        if not self.kml_doc:
+        if not self.kml_path:
             logger.error("No KML document loaded")
             return []
         
         # Define KML namespace
-        ns = {'kml': 'http://www.opengis.net/kml/2.2'}
+        ns = _KML_NS
         
         try:
-            # Find all Placemark elements that contain polygons
-            placemark_elements = self.kml_doc.xpath('//kml:Placemark', namespaces=ns)
-            logger.info(f"Found {len(placemark_elements)} placemark elements")
+            # Collect coordinates first so all polygons are built in one batch
+            coord_arrays = []
+            attributes_list = []
+            placemark_indices = []
             
-            for i, placemark_elem in enumerate(placemark_elements):
+            # Stream Placemark elements instead of holding the whole tree
+            placemark_count = 0
+            placemarks = etree.iterparse(self.kml_path, tag=_PLACEMARK_TAG, remove_blank_text=True)
+            for i, (_, placemark_elem) in enumerate(placemarks):
+                placemark_count += 1
                 try:
                     # Extract polygon from this placemark
-                    polygon_elem = placemark_elem.xpath('.//kml:Polygon', namespaces=ns)
-                    if not polygon_elem:
+                    polygon_elem = placemark_elem.find('.//kml:Polygon', ns)
+                    if polygon_elem is None:
                         continue
                     
-                    # Extract coordinates from the polygon
-                    coords = self._extract_polygon_coordinates(polygon_elem[0], ns)
-                    if coords and len(coords) >= 3:
-                        polygon = Polygon(coords)
-                        if polygon.is_valid:
-                            # Extract attributes from the placemark
-                            attributes = self._extract_placemark_attributes(placemark_elem, ns)
-                            polygons_with_attrs.append((polygon, attributes))
-                            logger.debug(f"Added valid polygon {i+1} with {len(coords)} coordinates and attributes: {attributes}")
-                        else:
-                            logger.warning(f"Invalid polygon geometry found at index {i}")
+                    # Extract coordinates from the polygon; an already closed
+                    # ring needs a fourth coordinate to enclose any area
+                    coords = self._extract_polygon_coordinates(polygon_elem, ns)
+                    if (coords is not None and len(coords) >= 3
+                            and (len(coords) >= 4 or not np.array_equal(coords[0], coords[-1]))):
+                        coord_arrays.append(coords)
+                        # Extract attributes from the placemark
+                        attributes_list.append(self._extract_placemark_attributes(placemark_elem, ns))
+                        placemark_indices.append(i)
                     else:
                         logger.warning(f"Insufficient coordinates for polygon at index {i}")
                         
                 except Exception as e:
                     logger.error(f"Error processing placemark {i}: {str(e)}")
                     
+                finally:
+                    # Free this placemark and the already processed siblings before it
+                    placemark_elem.clear()
+                    while placemark_elem.getprevious() is not None:
+                        del placemark_elem.getparent()[0]
+            
+            logger.info(f"Found {placemark_count} placemark elements")
+            
+            if coord_arrays:
+                # Rings, polygons and validity each take a single vectorized call
+                ring_indices = np.repeat(np.arange(len(coord_arrays)), [len(c) for c in coord_arrays])
+                rings = shapely.linearrings(np.concatenate(coord_arrays), indices=ring_indices)
+                polygons = shapely.polygons(rings)
+                valid = shapely.is_valid(polygons)
+                
+                for polygon, is_valid, attributes, i in zip(polygons, valid, attributes_list, placemark_indices):
+                    if is_valid:
+                        polygons_with_attrs.append((polygon, attributes))
+                        logger.debug(f"Added valid polygon {i+1} with {len(polygon.exterior.coords)} coordinates and attributes: {attributes}")
+                    else:
+                        logger.warning(f"Invalid polygon geometry found at index {i}")
+                    
+        except etree.XMLSyntaxError as e:
+            # load_kml only checks the root element; a document corrupted further
+            # on must not yield a silently partial set of polygons
+            logger.error(f"Malformed KML file {self.kml_path}: {str(e)}")
+            return []
+            
         except Exception as e:
             logger.error(f"Error extracting polygons: {str(e)}")
             
@@ -97,48 +174,48 @@ class KMLLoader:
         attributes = {}
         
         try:
-            # Extract name
-            name_elem = placemark_elem.xpath('.//kml:name', namespaces=ns)
-            if name_elem and name_elem[0].text:
-                attributes['name'] = name_elem[0].text.strip()
-            
-            # Extract styleUrl
-            style_elem = placemark_elem.xpath('.//kml:styleUrl', namespaces=ns)
-            if style_elem and style_elem[0].text:
-                style_url = style_elem[0].text.strip()
-                # Remove the # prefix if present
-                if style_url.startswith('#'):
-                    style_url = style_url[1:]
-                attributes['styleUrl'] = style_url
-            
-            # Extract description
-            desc_elem = placemark_elem.xpath('.//kml:description', namespaces=ns)
-            if desc_elem and desc_elem[0].text:
-                attributes['description'] = desc_elem[0].text.strip()
-            
-            # Extract ExtendedData
-            extended_data = placemark_elem.xpath('.//kml:ExtendedData//kml:Data', namespaces=ns)
-            for data_elem in extended_data:
-                name_attr = data_elem.get('name')
-                if name_attr:
-                    value_elem = data_elem.xpath('.//kml:value', namespaces=ns)
-                    if value_elem and value_elem[0].text:
-                        attributes[f'data_{name_attr}'] = value_elem[0].text.strip()
+            # One pass over the direct children instead of an XPath query per field
+            fields = {}
+            extended = {}
+            for child in placemark_elem:
+                tag = child.tag
+                if tag in _ATTRIBUTE_TAGS:
+                    if child.text and tag not in fields:
+                        fields[tag] = child.text.strip()
+                        
+                elif tag == _EXTENDED_DATA_TAG:
+                    for data_elem in child.iter(_DATA_TAG):
+                        name_attr = data_elem.get('name')
+                        if name_attr:
+                            value_elem = data_elem.find('.//kml:value', ns)
+                            if value_elem is not None and value_elem.text:
+                                extended[f'data_{name_attr}'] = value_elem.text.strip()
+            
+            # Keep a fixed key order regardless of element order in the file
+            for tag, key in _ATTRIBUTE_TAGS.items():
+                if tag in fields:
+                    attributes[key] = fields[tag]
+            
+            # Remove the # prefix from styleUrl if present
+            if attributes.get('styleUrl', '').startswith('#'):
+                attributes['styleUrl'] = attributes['styleUrl'][1:]
+                
+            attributes.update(extended)
             
         except Exception as e:
             logger.error(f"Error extracting placemark attributes: {str(e)}")
             
         return attributes
     
-    def _extract_polygon_coordinates(self, polygon_elem, ns) -> Optional[List[Tuple[float, float]]]:
-        """Extract coordinate pairs from a KML Polygon element."""
+    def _extract_polygon_coordinates(self, polygon_elem, ns) -> Optional[np.ndarray]:
+        """Extract an (N, 2) coordinate array from a KML Polygon element."""
         try:
             # Look for coordinates in outerBoundaryIs first, then innerBoundaryIs
-            outer_boundary = polygon_elem.xpath('.//kml:outerBoundaryIs//kml:coordinates', namespaces=ns)
+            outer_boundary = _XP_OUTER_COORDINATES(polygon_elem)
             
             if not outer_boundary:
                 # Try direct coordinates element (some KML files have this structure)
-                outer_boundary = polygon_elem.xpath('.//kml:coordinates', namespaces=ns)
+                outer_boundary = _XP_COORDINATES(polygon_elem)
             
             if outer_boundary:
                 coords_text = outer_boundary[0].text.strip()
@@ -151,26 +228,39 @@ class KMLLoader:
             logger.error(f"Error extracting coordinates: {str(e)}")
             return None
     
-    def _parse_coordinates_text(self, coords_text: str) -> List[Tuple[float, float]]:
-        """Parse KML coordinates text into list of (lon, lat) tuples."""
-        coordinates = []
+    def _parse_coordinates_text(self, coords_text: str) -> np.ndarray:
+        """Parse KML coordinates text into an (N, 2) array of (lon, lat) rows."""
+        # KML format is "longitude,latitude,altitude" (altitude is optional);
+        # parse every number in one C-level call and infer the tuple width
+        tuples = coords_text.split()
+        n_tuples = len(tuples)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)
+                values = np.fromstring(coords_text.replace(',', ' '), dtype=np.float64, sep=' ')
+            # A divisible count alone can't rule out mixed widths such as
+            # "1,2,3 4", so every tuple must also have the same comma count
+            if n_tuples and values.size % n_tuples == 0 and values.size // n_tuples >= 2:
+                commas = np.char.count(np.array(tuples), ',')
+                if np.all(commas == values.size // n_tuples - 1):
+                    return values.reshape(n_tuples, -1)[:, :2]
+        except ValueError:
+            # Newer numpy raises on malformed numbers instead of stopping early
+            pass
         
+        # Mixed tuple widths or malformed numbers: parse tuple by tuple,
+        # keeping the coordinates read before any error
+        coordinates = []
         try:
-            # Split by whitespace and newlines
-            coord_pairs = coords_text.split()
-            
-            for coord_pair in coord_pairs:
-                # KML format is "longitude,latitude,altitude" (altitude is optional)
+            for coord_pair in coords_text.split():
                 parts = coord_pair.split(',')
                 if len(parts) >= 2:
-                    lon = float(parts[0])
-                    lat = float(parts[1])
-                    coordinates.append((lon, lat))
+                    coordinates.append((float(parts[0]), float(parts[1])))
                     
         except Exception as e:
             logger.error(f"Error parsing coordinates text: {str(e)}")
             
-        return coordinates
+        return np.array(coordinates, dtype=np.float64).reshape(-1, 2)
 
 def load_kml_file(file_path: str) -> List[Polygon]:
     """
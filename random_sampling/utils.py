@@ -1,9 +1,30 @@
-from pathlib import Path
+from typing import Callable, List
 import math
+import os
+import numpy as np
 
-def gather_files_by_extension(folder: str, extension: str) -> list:
-    folder_path = Path(folder)
-    return list(folder_path.glob(f'*.{extension.lstrip(".")}'))
+def gather_files_by_extension(folder: str, extension: str) -> List[str]:
+    """
+    List the files in a folder with the given extension (non-recursive).
+    
+    Args:
+        folder: Directory to search
+        extension: File extension, with or without the leading dot
+        
+    Returns:
+        List[str]: Paths of the matching files
+    """
+    suffix = '.' + extension.lstrip('.')
+    with os.scandir(folder) as entries:
+        return [entry.path for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file()]
+
+# Earth's radius in meters
+EARTH_RADIUS_M = 6371000
+
+def _meters_per_degree(latitude: float) -> float:
+    """Meters spanned by one degree of longitude at a given latitude."""
+    return EARTH_RADIUS_M * math.pi / 180 * math.cos(math.radians(latitude))
 
 def meters_to_degrees(meters: float, latitude: float = 0.0) -> float:
     """
@@ -16,16 +37,7 @@ def meters_to_degrees(meters: float, latitude: float = 0.0) -> float:
     Returns:
         float: Distance in degrees
     """
-    # Earth's radius in meters
-    earth_radius = 6371000  # meters
-    
-    # Convert latitude to radians
-    lat_rad = math.radians(latitude)
-    
-    # Calculate degrees per meter at this latitude
-    degrees_per_meter = 1 / (earth_radius * math.cos(lat_rad))
-    
-    return meters * degrees_per_meter
+    return meters / _meters_per_degree(latitude)
 
 def degrees_to_meters(degrees: float, latitude: float = 0.0) -> float:
     """
@@ -38,16 +50,39 @@ def degrees_to_meters(degrees: float, latitude: float = 0.0) -> float:
     Returns:
         float: Distance in meters
     """
-    # Earth's radius in meters
-    earth_radius = 6371000  # meters
+    return degrees * _meters_per_degree(latitude)
+
+def make_deg_converter(latitude: float) -> Callable[[float], float]:
+    """
+    Build a meters-to-degrees converter for a fixed latitude.
     
-    # Convert latitude to radians
-    lat_rad = math.radians(latitude)
+    The cosine is evaluated once here rather than on every conversion.
     
-    # Calculate meters per degree at this latitude
-    meters_per_degree = earth_radius * math.cos(lat_rad)
+    Args:
+        latitude: Latitude in degrees
+        
+    Returns:
+        Callable: Function converting meters to degrees at that latitude
+    """
+    degrees_per_meter = 1 / _meters_per_degree(latitude)
     
-    return degrees * meters_per_degree
+    def convert(meters: float) -> float:
+        return meters * degrees_per_meter
+    
+    return convert
+
+def meters_to_degrees_arr(meters: np.ndarray, latitude: float = 0.0) -> np.ndarray:
+    """
+    Convert an array of distances from meters to degrees at a given latitude.
+    
+    Args:
+        meters: Distances in meters
+        latitude: Latitude in degrees (default: 0.0 for equator)
+        
+    Returns:
+        np.ndarray: Distances in degrees
+    """
+    return np.asarray(meters, dtype=np.float64) * (1 / _meters_per_degree(latitude))
 
 def get_center_latitude(bounds: tuple) -> float:
     """
@@ -61,3 +96,23 @@ def get_center_latitude(bounds: tuple) -> float:
     """
     minx, miny, maxx, maxy = bounds
     return (miny + maxy) / 2
+
+def get_utm_crs(bounds: tuple) -> str:
+    """
+    Get the WGS84 UTM zone CRS covering the center of boundary bounds.
+    
+    Args:
+        bounds: Tuple of (minx, miny, maxx, maxy) in degrees
+        
+    Returns:
+        str: EPSG code of the UTM zone (e.g. "EPSG:32618")
+    """
+    minx, miny, maxx, maxy = bounds
+    center_lon = (minx + maxx) / 2
+    center_lat = (miny + maxy) / 2
+    
+    zone = min(int((center_lon + 180) // 6) + 1, 60)
+    
+    # 326xx for the northern hemisphere, 327xx for the southern
+    hemisphere_code = 326 if center_lat >= 0 else 327
+    return f"EPSG:{hemisphere_code}{zone:02d}"
@@ -0,0 +1,17 @@
+"""
+Shared pytest fixtures.
+"""
+import pytest
+
+import random_sampling.boundary as boundary
+import random_sampling.generator as generator
+
+
+@pytest.fixture(params=[True, False], ids=["numba", "python"])
+def numba_backend(request, monkeypatch):
+    """Run a test with the numba kernels enabled, then with the Python fallbacks."""
+    if request.param and not boundary.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(boundary, "NUMBA_AVAILABLE", request.param)
+    monkeypatch.setattr(generator, "NUMBA_AVAILABLE", request.param)
+    return request.param
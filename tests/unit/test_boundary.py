@@ -0,0 +1,97 @@
+"""
+Tests for BoundaryHandler containment checks.
+"""
+import numpy as np
+import pytest
+import shapely
+import shapely.affinity
+from shapely.geometry import Point, Polygon, box
+
+from random_sampling.boundary import BoundaryHandler
+
+
+def hexagon(clockwise: bool = False, midpoints: bool = False) -> Polygon:
+    """Convex hexagon, optionally with a float-collinear midpoint on every edge."""
+    angles = np.linspace(0, 2 * np.pi, 6, endpoint=False) + 0.3
+    vertices = np.column_stack((137.1 + 41.3 * np.cos(angles), -12.7 + 29.9 * np.sin(angles)))
+    if midpoints:
+        following = np.roll(vertices, -1, axis=0)
+        vertices = np.stack((vertices, (vertices + following) / 2), axis=1).reshape(-1, 2)
+    if clockwise:
+        vertices = vertices[::-1]
+    return Polygon(vertices)
+
+
+def random_xy(polygon: Polygon, n: int = 20_000):
+    minx, miny, maxx, maxy = polygon.bounds
+    rng = np.random.default_rng(0)
+    return rng.uniform(minx - 1, maxx + 1, n), rng.uniform(miny - 1, maxy + 1, n)
+
+
+@pytest.mark.parametrize("clockwise", [False, True])
+@pytest.mark.parametrize("midpoints", [False, True])
+def test_convex_fast_path_matches_shapely(clockwise, midpoints):
+    polygon = hexagon(clockwise, midpoints)
+    handler = BoundaryHandler([polygon])
+    xs, ys = random_xy(polygon)
+
+    assert handler._half_planes[0] is not None
+    np.testing.assert_array_equal(
+        handler.contains_points_fast(xs, ys), shapely.contains_xy(polygon, xs, ys)
+    )
+
+
+def test_concave_polygon_skips_convex_fast_path():
+    polygon = Polygon([(0, 0), (4, 0), (4, 4), (2, 1), (0, 4)])
+    handler = BoundaryHandler([polygon])
+    xs, ys = random_xy(polygon)
+
+    assert handler._half_planes[0] is None
+    np.testing.assert_array_equal(
+        handler.contains_points_fast(xs, ys), shapely.contains_xy(polygon, xs, ys)
+    )
+
+
+def holed_l_shape() -> Polygon:
+    exterior = [(0, 0), (60, 0), (60, 20), (20, 20), (20, 60), (0, 60)]
+    hole = [(5, 5), (15, 5), (15, 15), (5, 15)]
+    return Polygon(exterior, [hole])
+
+
+def test_concave_holed_polygon_matches_shapely(numba_backend):
+    polygons = [holed_l_shape(), shapely.affinity.translate(holed_l_shape(), 100, 0)]
+    handler = BoundaryHandler(polygons)
+    xs, ys = random_xy(shapely.MultiPolygon(polygons))
+
+    for index, polygon in enumerate(polygons):
+        np.testing.assert_array_equal(
+            handler.contains_points_fast(xs, ys, index=index), shapely.contains_xy(polygon, xs, ys)
+        )
+    np.testing.assert_array_equal(
+        handler.contains_points_fast(xs, ys),
+        shapely.contains_xy(polygons[0], xs, ys) | shapely.contains_xy(polygons[1], xs, ys),
+    )
+
+
+@pytest.mark.parametrize("xy", [(0.5, 0.5), (1.5, 0.5), (1.0, 0.5), (0.0, 0.5), (2.5, 0.5)])
+def test_contains_xy_matches_contains_point(xy):
+    handler = BoundaryHandler([box(0, 0, 1, 1), box(1, 0, 2, 1)])
+
+    assert handler.contains_xy(*xy) == handler.contains_point(Point(*xy))
+
+
+def test_multipolygon_matches_shapely(numba_backend):
+    island = box(8, 8, 12, 12)
+    multipolygon = shapely.MultiPolygon([holed_l_shape(), island, box(100, 0, 120, 20)])
+    combined = BoundaryHandler([box(200, 0, 210, 10), box(210, 0, 220, 10)]).get_combined_boundary()
+    handler = BoundaryHandler([multipolygon, combined])
+    xs, ys = random_xy(shapely.MultiPolygon([*multipolygon.geoms, *shapely.get_parts(combined)]))
+
+    for index, geometry in enumerate([multipolygon, combined]):
+        np.testing.assert_array_equal(
+            handler.contains_points_fast(xs, ys, index=index), shapely.contains_xy(geometry, xs, ys)
+        )
+    np.testing.assert_array_equal(
+        handler.contains_points_fast(xs, ys),
+        shapely.contains_xy(multipolygon, xs, ys) | shapely.contains_xy(combined, xs, ys),
+    )
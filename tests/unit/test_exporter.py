@@ -0,0 +1,23 @@
+"""
+Tests for CSV export.
+"""
+import numpy as np
+import pytest
+import shapely
+
+from random_sampling.exporter import STREAM_CHUNK_SIZE, SamplingPointExporter
+
+
+@pytest.mark.parametrize("n_points", [1, 12_345, STREAM_CHUNK_SIZE + 7])
+@pytest.mark.parametrize("metadata", [None, {"site": "north", "round": 2}])
+def test_streamed_csv_matches_dataframe_csv(tmp_path, n_points, metadata):
+    rng = np.random.default_rng(n_points)
+    points = list(shapely.points(rng.uniform(-180, 180, (n_points, 2))))
+    exporter = SamplingPointExporter()
+    streamed = tmp_path / "streamed.csv"
+    buffered = tmp_path / "buffered.csv"
+
+    assert exporter.export_to_csv(points, str(streamed), metadata=metadata, stream=True)
+    assert exporter.export_to_csv(points, str(buffered), metadata=metadata, stream=False)
+
+    assert streamed.read_bytes() == buffered.read_bytes()
@@ -0,0 +1,163 @@
+"""
+Tests for variable-density minimum-distance sampling.
+"""
+import numpy as np
+import pytest
+import shapely
+import shapely.affinity
+from shapely.geometry import Polygon, box
+
+from random_sampling.boundary import BoundaryHandler
+from random_sampling.generator import (
+    RandomPointGenerator,
+    _candidate_triangles,
+    _cap_to_packing_limit,
+    _uses_compiled_sampler,
+    generate_sampling_points,
+)
+
+RADIUS_FUNCTIONS = {
+    "constant": lambda x, y: 5.0,
+    "ramp": lambda x, y: 2.0 + 18.0 * x / 400.0,
+    "sinusoidal": lambda x, y: 3.0 + 3.0 * np.sin(x / 50.0),
+    "zero": lambda x, y: 0.0,
+}
+
+
+def assert_pairwise_spacing(xy: np.ndarray, radius) -> None:
+    """Every pair of points must be at least max(r_i, r_j) apart."""
+    radii = np.array([radius(x, y) for x, y in xy])
+    for i in range(len(xy)):
+        distances = np.hypot(xy[:, 0] - xy[i, 0], xy[:, 1] - xy[i, 1])
+        distances[i] = np.inf
+        limits = np.maximum(radii, radii[i])
+        assert not np.any(distances < limits), f"point {i} violates its minimum distance"
+
+
+@pytest.mark.parametrize("name", sorted(RADIUS_FUNCTIONS))
+def test_variable_distance_combined_boundary(name):
+    radius = RADIUS_FUNCTIONS[name]
+    polygon = box(0, 0, 400, 100)
+    generator = RandomPointGenerator(BoundaryHandler([polygon]))
+
+    points = generator.generate_points_with_minimum_distance(800, radius, seed=1)
+    xy = shapely.get_coordinates(points)
+
+    assert len(xy) > 0
+    assert shapely.contains_xy(polygon, xy[:, 0], xy[:, 1]).all()
+    assert_pairwise_spacing(xy, radius)
+
+
+@pytest.mark.parametrize("name", sorted(RADIUS_FUNCTIONS))
+def test_variable_distance_per_polygon(name):
+    radius = RADIUS_FUNCTIONS[name]
+    polygons = [box(0, 0, 400, 100), box(500, 0, 900, 100)]
+    handler = BoundaryHandler(polygons)
+
+    xy = RandomPointGenerator(handler).generate_points_per_polygon_array(
+        300, seed=1, min_distance=radius
+    )
+
+    assert len(xy) > 0
+    for polygon in polygons:
+        inside = shapely.contains_xy(polygon, xy[:, 0], xy[:, 1])
+        assert inside.any()
+        assert_pairwise_spacing(xy[inside], radius)
+
+
+def test_variable_distance_through_generate_sampling_points():
+    handler = BoundaryHandler([box(0, 0, 400, 100)])
+
+    points = generate_sampling_points(handler, 100, seed=1, min_distance=RADIUS_FUNCTIONS["ramp"])
+
+    assert len(points) == 100
+
+
+@pytest.mark.parametrize("min_distance", [0, -1.0])
+def test_non_positive_distance_per_polygon_falls_back_to_uniform(min_distance):
+    polygons = [box(0, 0, 400, 100), box(500, 0, 900, 100)]
+    handler = BoundaryHandler(polygons)
+
+    xy = RandomPointGenerator(handler).generate_points_per_polygon_array(
+        50, seed=1, min_distance=min_distance
+    )
+
+    assert xy.shape == (100, 2)
+    for polygon in polygons:
+        assert shapely.contains_xy(polygon, xy[:, 0], xy[:, 1]).sum() == 50
+
+
+def holed_l_shape():
+    exterior = [(0, 0), (60, 0), (60, 20), (20, 20), (20, 60), (0, 60)]
+    hole = [(5, 5), (15, 5), (15, 15), (5, 15)]
+    return Polygon(exterior, [hole])
+
+
+def sample_per_polygon(polygons, n_points, min_distance, seed):
+    generator = RandomPointGenerator(BoundaryHandler(polygons))
+    return generator.generate_points_per_polygon_array(n_points, seed=seed, min_distance=min_distance)
+
+
+def test_per_polygon_sampler_spacing_and_containment(numba_backend):
+    polygon = holed_l_shape()
+    assert _uses_compiled_sampler(polygon.bounds, 2.0) == numba_backend
+
+    xy = sample_per_polygon([polygon], 200, 2.0, seed=7)
+
+    assert len(xy) == 200
+    assert shapely.contains_xy(polygon, xy[:, 0], xy[:, 1]).all()
+    assert_pairwise_spacing(xy, lambda x, y: 2.0)
+
+
+def test_per_polygon_sampler_is_reproducible(numba_backend):
+    polygons = [holed_l_shape(), box(100, 0, 160, 60)]
+
+    first = sample_per_polygon(polygons, 100, 2.0, seed=11)
+
+    np.testing.assert_array_equal(first, sample_per_polygon(polygons, 100, 2.0, seed=11))
+    assert not np.array_equal(first, sample_per_polygon(polygons, 100, 2.0, seed=12))
+
+
+def test_packing_limit_caps_saturated_requests(numba_backend):
+    polygon = box(0, 0, 100, 100)
+    limit = _cap_to_packing_limit(10**6, polygon.area, polygon.length, 5.0)
+
+    xy = sample_per_polygon([polygon], 10**6, 5.0, seed=3)
+
+    assert _cap_to_packing_limit(50, polygon.area, polygon.length, 5.0) == 50
+    assert 0.8 * limit <= len(xy) <= limit
+    assert_pairwise_spacing(xy, lambda x, y: 5.0)
+
+
+def test_per_polygon_sampler_on_multipolygon(numba_backend):
+    multipolygon = shapely.MultiPolygon([holed_l_shape(), box(8, 8, 12, 12), box(100, 0, 120, 20)])
+
+    xy = sample_per_polygon([multipolygon], 150, 2.0, seed=5)
+
+    assert len(xy) == 150
+    assert shapely.contains_xy(multipolygon, xy[:, 0], xy[:, 1]).all()
+    assert_pairwise_spacing(xy, lambda x, y: 2.0)
+
+
+C_SHAPE = Polygon([(0, 0), (100, 0), (100, 10), (10, 10), (10, 90), (100, 90), (100, 100), (0, 100)])
+ROTATED_STRIP = shapely.affinity.rotate(box(0, 0, 2000, 20), 30, origin=(0, 0))
+
+
+@pytest.mark.parametrize(
+    "polygon, part",
+    [
+        (C_SHAPE, box(0, 0, 100, 10)),
+        (ROTATED_STRIP, shapely.affinity.rotate(box(0, 0, 500, 20), 30, origin=(0, 0))),
+    ],
+    ids=["c-shape", "rotated-strip"],
+)
+def test_triangle_candidates_for_poorly_filled_bounds(numba_backend, polygon, part):
+    assert _candidate_triangles(polygon) is not None
+
+    xy = sample_per_polygon([polygon], 400, 2.0, seed=9)
+
+    assert len(xy) == 400
+    assert shapely.contains_xy(polygon, xy[:, 0], xy[:, 1]).all()
+    assert_pairwise_spacing(xy, lambda x, y: 2.0)
+    share = shapely.contains_xy(part, xy[:, 0], xy[:, 1]).mean()
+    assert share == pytest.approx(part.area / polygon.area, abs=0.08)
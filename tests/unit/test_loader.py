@@ -0,0 +1,130 @@
+"""
+Tests for KML loading and placemark extraction.
+"""
+import numpy as np
+import pytest
+
+from random_sampling.loader import KMLLoader
+
+PLACEMARK = """
+    <Placemark>
+      <name>{name}</name>
+      <Polygon><outerBoundaryIs><LinearRing>
+        <coordinates>0,0,0 1,0,0 1,1,0 0,1,0 0,0,0</coordinates>
+      </LinearRing></outerBoundaryIs></Polygon>
+    </Placemark>"""
+
+
+def kml_document(*names: str) -> str:
+    placemarks = "".join(PLACEMARK.format(name=name) for name in names)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+        f"{placemarks}\n  </Document></kml>\n"
+    )
+
+
+def write(tmp_path, text: str, name: str = "polygons.kml") -> str:
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_load_kml_accepts_kml_document(tmp_path):
+    loader = KMLLoader()
+
+    assert loader.load_kml(write(tmp_path, kml_document("A")))
+    assert [attrs["name"] for _, attrs in loader.extract_polygons_with_attributes()] == ["A"]
+
+
+@pytest.mark.parametrize("text", ["", "not xml at all", "<html><body/></html>"])
+def test_load_kml_rejects_non_kml_files(tmp_path, text):
+    loader = KMLLoader()
+
+    assert not loader.load_kml(write(tmp_path, text))
+    assert loader.kml_path is None
+
+
+def test_load_kml_rejects_missing_file(tmp_path):
+    assert not KMLLoader().load_kml(str(tmp_path / "missing.kml"))
+
+
+def test_truncated_document_extracts_no_polygons(tmp_path):
+    text = kml_document("A", "B", "C")
+    loader = KMLLoader()
+
+    assert loader.load_kml(write(tmp_path, text[:text.rindex("<Placemark>")]))
+    assert loader.extract_polygons_with_attributes() == []
+
+
+def test_kml_doc_parses_the_loaded_file(tmp_path):
+    loader = KMLLoader()
+    assert loader.kml_doc is None
+
+    loader.load_kml(write(tmp_path, kml_document("A")))
+
+    assert loader.kml_doc.getroot().tag == "{http://www.opengis.net/kml/2.2}kml"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("1.5,2 3,4 5,6", [[1.5, 2], [3, 4], [5, 6]]),
+        ("1,2,0\n  3,4,0\t5,6,10", [[1, 2], [3, 4], [5, 6]]),
+        ("1,2 3,4,9 5,6", [[1, 2], [3, 4], [5, 6]]),
+        ("1,2,3 4", [[1, 2]]),
+        (" \n\t ", []),
+        ("a,b c,d", []),
+        ("1,2 x,4 5,6", [[1, 2]]),
+    ],
+)
+def test_parse_coordinates_text(text, expected):
+    coords = KMLLoader()._parse_coordinates_text(text)
+
+    assert coords.shape == (len(expected), 2)
+    np.testing.assert_array_equal(coords, np.array(expected, dtype=np.float64).reshape(-1, 2))
+
+
+def placemark_with_ring(name: str, coordinates: str) -> str:
+    return PLACEMARK.replace("{name}", name).replace(
+        "0,0,0 1,0,0 1,1,0 0,1,0 0,0,0", coordinates
+    )
+
+
+def test_ring_needs_three_distinct_coordinates(tmp_path):
+    text = kml_document().replace(
+        "\n  </Document>",
+        placemark_with_ring("open triangle", "0,0 1,0 0,1")
+        + placemark_with_ring("closed triangle", "0,0 1,0 0,1 0,0")
+        + placemark_with_ring("closed pair", "0,0 1,0 0,0")
+        + "\n  </Document>",
+    )
+    loader = KMLLoader()
+    loader.load_kml(write(tmp_path, text))
+
+    names = [attrs["name"] for _, attrs in loader.extract_polygons_with_attributes()]
+
+    assert names == ["open triangle", "closed triangle"]
+
+
+def test_placemark_attributes(tmp_path):
+    placemark = PLACEMARK.format(name="Chardonnay").replace(
+        "<name>Chardonnay</name>",
+        "<description> vgb </description><styleUrl>#poly-3949AB</styleUrl>"
+        "<name>Chardonnay</name><name>ignored</name>"
+        '<ExtendedData><Data name="block"><value> 7 </value></Data>'
+        '<Data name="empty"><value/></Data></ExtendedData>',
+    )
+    text = kml_document().replace("\n  </Document>", placemark + "\n  </Document>")
+    loader = KMLLoader()
+    loader.load_kml(write(tmp_path, text))
+
+    [(polygon, attrs)] = loader.extract_polygons_with_attributes()
+
+    assert list(attrs.items()) == [
+        ("name", "Chardonnay"),
+        ("styleUrl", "poly-3949AB"),
+        ("description", "vgb"),
+        ("data_block", "7"),
+    ]
+    assert polygon.area == 1.0
@@ -0,0 +1,89 @@
+"""
+Tests for unit conversions and the metric projection used by the CLI.
+"""
+import sys
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyproj
+import pytest
+import shapely
+
+from random_sampling import cli
+from random_sampling.loader import load_kml_file
+from random_sampling.utils import (
+    degrees_to_meters,
+    get_utm_crs,
+    make_deg_converter,
+    meters_to_degrees,
+    meters_to_degrees_arr,
+)
+
+TEST_KML = Path(__file__).resolve().parents[2] / "data" / "Test Polygons.kml"
+
+
+def test_meters_to_degrees_at_equator():
+    assert meters_to_degrees(111_320, 0) == pytest.approx(1.0, rel=2e-3)
+    assert degrees_to_meters(meters_to_degrees(250.0, 42.8), 42.8) == pytest.approx(250.0)
+
+
+@pytest.mark.parametrize("latitude", [0.0, 42.83, -33.9, 60.0])
+def test_deg_converters_match_scalar_form(latitude):
+    meters = np.array([0.0, 1.0, 5.0, 1234.5])
+    convert = make_deg_converter(latitude)
+
+    for m in meters:
+        assert convert(m) == pytest.approx(meters_to_degrees(m, latitude), rel=1e-12)
+    np.testing.assert_allclose(
+        meters_to_degrees_arr(meters, latitude),
+        [meters_to_degrees(m, latitude) for m in meters],
+        rtol=1e-12,
+    )
+
+
+@pytest.mark.parametrize(
+    "bounds, expected",
+    [
+        ((-77.04, 42.82, -77.01, 42.84), "EPSG:32618"),
+        ((18.40, -33.95, 18.45, -33.90), "EPSG:32734"),
+        ((179.9, 10.0, 180.0, 10.1), "EPSG:32660"),
+        ((180.0, -10.1, 180.0, -10.0), "EPSG:32760"),
+        ((-180.0, 0.0, -179.9, 0.1), "EPSG:32601"),
+    ],
+)
+def test_get_utm_crs(bounds, expected):
+    assert get_utm_crs(bounds) == expected
+
+
+def test_bundled_kml_uses_utm_zone_18_north():
+    polygons = load_kml_file(str(TEST_KML))
+
+    assert get_utm_crs(shapely.total_bounds(polygons)) == "EPSG:32618"
+
+
+def test_cli_samples_in_utm_and_exports_lon_lat(tmp_path, monkeypatch):
+    output = tmp_path / "samples.csv"
+    min_distance = 10.0
+    monkeypatch.setattr(sys, "argv", [
+        "random-sampling", "--file", str(TEST_KML), "--n_points", "20",
+        "--min_distance_meters", str(min_distance), "--seed", "1", "--output", str(output),
+    ])
+
+    cli.main()
+
+    samples = pd.read_csv(output)
+    lons, lats = samples["longitude"].to_numpy(), samples["latitude"].to_numpy()
+    geod = pyproj.Geod(ellps="WGS84")
+    polygons = load_kml_file(str(TEST_KML))
+    assigned = np.zeros(len(samples), dtype=bool)
+    for polygon in polygons:
+        inside = np.flatnonzero(shapely.contains_xy(polygon, lons, lats))
+        assert len(inside) == 20
+        assigned[inside] = True
+        for i, j in combinations(inside, 2):
+            _, _, distance = geod.inv(lons[i], lats[i], lons[j], lats[j])
+            # UTM's scale factor shrinks distances by at most 0.04% in a zone
+            assert distance >= min_distance * 0.9995
+    assert assigned.all()